@@ -6,6 +6,7 @@ from typing import List
 import csv
 import json
 from parse_local_genre_xml import get_genre_pages_from_local_xml
+from work_dedup import WorkDeduplicator
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (compatible; MyGoodreadsCrawler/1.0; +https://yourdomain.example)'
@@ -222,6 +223,7 @@ def main():
     genre_book_count = {g: 0 for g in allowed_genres}
     genre_completion_counter = 0  # Counter for completed genres
     total_books_extracted = 0  # Counter for successfully extracted books
+    work_dedup = WorkDeduplicator()  # Groups editions of the same work as they are crawled
     
     for genre_url in filtered_genre_urls:
         # Determine which genre this URL is for
@@ -260,6 +262,7 @@ def main():
                     data = extract_book_data(url)
                     # Only add if the book's genre matches the matched_genre
                     if data['genre'] and data['genre'].lower() == matched_genre.lower():
+                        data['work_id'] = work_dedup.add(data)
                         all_books.append(data)
                         genre_book_count[matched_genre] += 1
                         total_books_extracted += 1
@@ -304,11 +307,12 @@ def main():
     print("\nBooks per genre:")
     for genre in allowed_genres:
         print(f"{genre}: {genre_book_count[genre]} books")
+    print(f"Distinct works: {len(set(book['work_id'] for book in all_books))}")
     
     with open('output/books.json', 'w', encoding='utf-8') as f:
         json.dump(all_books, f, ensure_ascii=False, indent=2)
     with open('output/books.csv', 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['title', 'author', 'url', 'description', 'rating', 'genre'])
+        writer = csv.DictWriter(f, fieldnames=['title', 'author', 'url', 'description', 'rating', 'genre', 'work_id'])
         writer.writeheader()
         for book in all_books:
             book_out = {k: v for k, v in book.items() if k != 'reviews'}
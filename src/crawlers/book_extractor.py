@@ -4,6 +4,7 @@ import json
 import csv
 from parse_local_genre_xml import get_genre_pages_from_local_xml
 from book_crawler_genre import extract_book_data
+from work_dedup import assign_work_ids
 
 def fetch_sample_book_editions_urls():
     # Dummy implementation: you should replace this with actual logic to fetch edition URLs
@@ -30,13 +31,15 @@ def main():
             time.sleep(5)  # Polite delay between requests
         except Exception as e:
             print(f"Failed to extract {url}: {e}")
+    # Group editions of the same work under a shared work_id
+    assign_work_ids(books)
     # Save to JSON for use in Streamlit
     with open('output/books.json', 'w', encoding='utf-8') as f:
         json.dump(books, f, ensure_ascii=False, indent=2)
     print("Book data saved to output/books.json.")
     # Save to CSV as well
     with open('output/books.csv', 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['title', 'author', 'url', 'description', 'rating', 'genre'])
+        writer = csv.DictWriter(f, fieldnames=['title', 'author', 'url', 'description', 'rating', 'genre', 'work_id'])
         writer.writeheader()
         for book in books:
             # Remove 'reviews' key if present
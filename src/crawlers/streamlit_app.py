@@ -9,6 +9,7 @@ import time
 import threading
 from datetime import datetime, timedelta
 from book_crawler_genre import main as crawl_books
+from work_dedup import assign_work_ids
 
 def load_books_json():
     if os.path.exists('output/books.json'):
@@ -213,11 +214,15 @@ def main():
         return
     # Top Extracted Data
     st.header('Top Extracted Books by Rating')
+    # Older crawl output has no work_id, so group those editions into works here
+    # while keeping the ids the crawler already stored
+    if not all(book.get('work_id') for book in books):
+        books = assign_work_ids([dict(book) for book in books])
     df = pd.DataFrame(books)
     df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
-    # Remove duplicate books based on title and author
-    df = df.drop_duplicates(subset=['title', 'author'])
-    top_books = df.sort_values(by='rating', ascending=False).head(10)
+    df = df.sort_values(by='rating', ascending=False)
+    # Keep only the highest rated edition of each work
+    top_books = df.drop_duplicates(subset=['work_id']).head(10)
     st.dataframe(top_books[['title', 'author', 'rating', 'genre', 'url']])
     # Display raw JSON data (first 5 books) as a table
     st.header('Sample Book Data (Table)')
@@ -266,8 +271,9 @@ def main():
     # Top Rated Books by Genre
     st.header('Top Rated Books by Genre')
     if not df.empty:
-        # Group by genre and get the highest rated book for each
-        top_by_genre = df.sort_values('rating', ascending=False).groupby('genre').first().reset_index()
+        # Count each work once per genre, then get the highest rated book for each genre
+        genre_df = df.drop_duplicates(subset=['genre', 'work_id'])
+        top_by_genre = genre_df.groupby('genre').first().reset_index()
         
         # Create a bar chart using plotly
         fig = px.bar(top_by_genre, 
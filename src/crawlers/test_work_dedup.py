@@ -0,0 +1,71 @@
+from work_dedup import assign_work_ids, series_volume
+
+MOCKINGBIRD = {
+    'url': 'https://www.goodreads.com/book/show/1',
+    'title': 'To Kill a Mockingbird',
+    'author': 'Harper Lee',
+    'description': (
+        'One of the best-loved stories of all time, To Kill a Mockingbird has been '
+        'translated into more than forty languages, sold more than forty million '
+        'copies worldwide and was voted one of the best novels of the twentieth century.'
+    ),
+}
+
+def edition(**fields):
+    book = dict(MOCKINGBIRD, url='https://www.goodreads.com/book/show/2')
+    book.update(fields)
+    return book
+
+def work_ids(*books):
+    return [book['work_id'] for book in assign_work_ids([dict(b) for b in books])]
+
+def test_casing_and_series_suffix_merge():
+    first = edition(title='Chamber of Secrets (Harry Potter, #2)', url='a')
+    second = edition(title='CHAMBER OF SECRETS (Harry Potter #2)', url='b')
+    assert work_ids(first, second) == ['a', 'a']
+
+def test_series_suffix_matches_plain_title():
+    suffixed = edition(title='The Hunger Games (The Hunger Games, #1)', author='Suzanne Collins', url='a')
+    plain = edition(title='The Hunger Games', author='Suzanne Collins', url='b')
+    assert work_ids(suffixed, plain) == ['a', 'a']
+
+def test_reworded_description_merges():
+    reworded = edition(description=(
+        'A gripping, heart-wrenching coming-of-age tale in a South poisoned by '
+        'virulent prejudice, seen through the eyes of a young girl.'
+    ))
+    assert len(set(work_ids(MOCKINGBIRD, reworded))) == 1
+
+def test_missing_description_merges():
+    assert len(set(work_ids(MOCKINGBIRD, edition(description=None)))) == 1
+
+def test_different_volumes_stay_apart():
+    books = [
+        {'url': 'a', 'title': 'Harry Potter and the Chamber of Secrets (Harry Potter, #2)',
+         'author': 'J.K. Rowling', 'description': None},
+        {'url': 'b', 'title': 'Harry Potter and the Goblet of Fire',
+         'author': 'J.K. Rowling', 'description': None},
+        {'url': 'c', 'title': 'Harry Potter and the Prisoner of Azkaban',
+         'author': 'J.K. Rowling', 'description': None},
+        {'url': 'f', 'title': 'Harry Potter and the Chamber of Secrets (Harry Potter, #3)',
+         'author': 'J.K. Rowling', 'description': None},
+        {'url': 'd', 'title': 'Cursed Princess Club, vol. 1', 'author': 'LambCat'},
+        {'url': 'e', 'title': 'Cursed Princess Club, vol. 2', 'author': 'LambCat'},
+    ]
+    assert work_ids(*books) == ['a', 'b', 'c', 'f', 'd', 'e']
+
+def test_different_author_stays_apart():
+    assert len(set(work_ids(MOCKINGBIRD, edition(author='Someone Else')))) == 2
+
+def test_empty_books_stay_apart():
+    empty = {'title': None, 'author': None, 'description': None}
+    assert work_ids(dict(empty, url='a'), dict(empty, url='b')) == ['a', 'b']
+
+def test_existing_work_ids_are_kept():
+    stored = dict(MOCKINGBIRD, work_id='stored')
+    assert work_ids(edition(url='new'), stored) == ['stored', 'stored']
+
+def test_series_volume():
+    assert series_volume('Chamber of Secrets (Harry Potter, #2)') == '2'
+    assert series_volume('Cursed Princess Club, vol. 1') == '1'
+    assert series_volume('To Kill a Mockingbird') is None
@@ -0,0 +1,158 @@
+import re
+import random
+import zlib
+
+# MinHash / LSH settings: 24 bands of 4 rows puts the LSH threshold near a
+# Jaccard similarity of (1/24) ** (1/4) ~= 0.45, well below TITLE_THRESHOLD,
+# so title pairs at the cutoff become candidates with probability > 0.99
+NUM_PERM = 96
+NUM_BANDS = 24
+# Candidates are then confirmed with the exact Jaccard similarity of the shingles
+TITLE_THRESHOLD = 0.7
+AUTHOR_THRESHOLD = 0.5
+DESCRIPTION_WORDS = 60
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Seeded so the same book always gets the same signature between crawls
+_rng = random.Random(550)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_SERIES_SUFFIX = re.compile(r'\(([^)]*?)#\s*([\d.]+)[^)]*\)')
+_VOLUME = re.compile(r'\bvol(?:ume)?\.?\s*(\d+)', re.IGNORECASE)
+
+def normalize_text(text):
+    """Lowercase, drop series suffixes like '(Series #1)' and punctuation"""
+    if not text:
+        return ''
+    text = text.lower()
+    text = _SERIES_SUFFIX.sub(' ', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    return ' '.join(text.split())
+
+def series_volume(title):
+    """Return the series volume number of a title, e.g. '2' for '(Series, #2)'"""
+    if not title:
+        return None
+    match = _SERIES_SUFFIX.search(title)
+    if match:
+        return match.group(2).rstrip('.')
+    match = _VOLUME.search(title)
+    if match:
+        return match.group(1)
+    return None
+
+def char_shingles(text, k=3):
+    """Character k-grams of a normalized string, empty for an empty string"""
+    if not text:
+        return set()
+    return {text[i:i + k] for i in range(max(len(text) - k + 1, 1))}
+
+def get_shingles(book):
+    """Build the title, author and description shingle sets for a book"""
+    # Character 3-grams on title and author tolerate small spelling differences
+    title = char_shingles(normalize_text(book.get('title')))
+    author = char_shingles(normalize_text(book.get('author')).replace(' ', ''))
+    # Word pairs on the opening of the description are only used as a tiebreak
+    words = normalize_text(book.get('description')).split()[:DESCRIPTION_WORDS]
+    description = {words[i] + ' ' + words[i + 1] for i in range(len(words) - 1)}
+    return title, author, description
+
+def jaccard(set1, set2):
+    """Exact Jaccard similarity of two sets, 0 when both are empty"""
+    if not set1 and not set2:
+        return 0.0
+    return len(set1 & set2) / len(set1 | set2)
+
+def minhash_signature(shingles):
+    """Compute a MinHash signature of NUM_PERM values for a shingle set"""
+    hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+class WorkDeduplicator:
+    """Groups book editions into works incrementally using MinHash and LSH"""
+
+    def __init__(self):
+        self.rows = NUM_PERM // NUM_BANDS
+        self.buckets = [{} for _ in range(NUM_BANDS)]
+        self.entries = []
+        self.count = 0
+
+    def _is_same_work(self, entry, volume, author):
+        """Check volume and author of an LSH candidate whose title already matched"""
+        # A missing volume or author on one side is not evidence either way
+        if entry['volume'] and volume and entry['volume'] != volume:
+            return False
+        if entry['author'] and author:
+            return jaccard(entry['author'], author) >= AUTHOR_THRESHOLD
+        return True
+
+    def add(self, book, work_id=None):
+        """Index a book and return the work_id of the work it belongs to
+
+        If work_id is given the book is indexed under it without matching,
+        which keeps ids stored by an earlier crawl stable.
+        """
+        self.count += 1
+        title, author, description = get_shingles(book)
+        fallback_id = book.get('url') or f"work-{self.count}"
+        if not title:
+            # Without a title there is nothing reliable to match on
+            return work_id or fallback_id
+        volume = series_volume(book.get('title'))
+        signature = minhash_signature(title)
+        band_keys = [
+            tuple(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(NUM_BANDS)
+        ]
+        if work_id is None:
+            # Only books sharing at least one LSH band are compared
+            candidates = set()
+            for band, key in enumerate(band_keys):
+                candidates.update(self.buckets[band].get(key, ()))
+            best = None
+            for idx in candidates:
+                entry = self.entries[idx]
+                if jaccard(entry['title'], title) < TITLE_THRESHOLD:
+                    continue
+                if not self._is_same_work(entry, volume, author):
+                    continue
+                # The description only breaks ties between matching works
+                score = (jaccard(entry['description'], description), -idx)
+                if best is None or score > best[0]:
+                    best = (score, entry['work_id'])
+            work_id = best[1] if best else fallback_id
+        idx = len(self.entries)
+        self.entries.append({
+            'work_id': work_id,
+            'title': title,
+            'author': author,
+            'description': description,
+            'volume': volume,
+        })
+        for band, key in enumerate(band_keys):
+            self.buckets[band].setdefault(key, []).append(idx)
+        return work_id
+
+def assign_work_ids(books):
+    """Set a 'work_id' on every book dict so editions of one work share it
+
+    Books that already have a work_id keep it; the rest are matched against them.
+    """
+    dedup = WorkDeduplicator()
+    for book in books:
+        if book.get('work_id'):
+            dedup.add(book, work_id=book['work_id'])
+    for book in books:
+        if not book.get('work_id'):
+            book['work_id'] = dedup.add(book)
+    return books